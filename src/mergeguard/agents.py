@@ -7,111 +7,141 @@ from typing import TYPE_CHECKING
 
 from mistralai import CompletionArgs, ResponseFormat, JSONSchema
 
+from mergeguard.batch import BatchReporter
 from mergeguard.schemas import ReviewReport
 from mergeguard.tools import (
-    PLANNER_TOOLS,
+    PLAN_AND_REVIEW_TOOLS,
     REPORTER_TOOLS,
-    REVIEWER_TOOLS,
     VERIFIER_TOOLS,
 )
 
 if TYPE_CHECKING:
     from mistralai import Mistral
 
+# ── Structured output ──────────────────────────────────────────────────
+
+# The report schema is static, so generate it (and the completion args
+# wrapping it) once at import rather than on every create_reporter call.
+_REPORT_SCHEMA = ReviewReport.to_json_schema()["json_schema"]["schema"]
+
+_REPORTER_RESPONSE_FORMAT = ResponseFormat(
+    type="json_schema",
+    json_schema=JSONSchema(
+        name="ReviewReport",
+        schema=_REPORT_SCHEMA,
+    ),
+)
+
+_REPORTER_COMPLETION_ARGS = CompletionArgs(
+    temperature=0.1,
+    response_format=_REPORTER_RESPONSE_FORMAT,
+)
+
+# Plain-dict form for chat-completion batch requests (see BatchReporter).
+_REPORTER_RESPONSE_FORMAT_DICT = _REPORTER_RESPONSE_FORMAT.model_dump(
+    by_alias=True, exclude_none=True
+)
+
 # ── Prompt loading ─────────────────────────────────────────────────────
 
+# Resolved once; importlib.resources works the same for source-tree,
+# editable, wheel and zip installs.
+_PROMPTS_DIR = importlib.resources.files("mergeguard") / "prompts"
 
-def _load_prompt(name: str) -> str:
-    """Load an agent's system prompt from the prompts package data.
 
-    Uses importlib.resources so prompts are resolved correctly whether
-    running from source, an installed wheel, or a zip archive.
-    Falls back to Path(__file__)-relative resolution for editable installs.
-    """
-    # Try importlib.resources first (works with package_data / installed)
+# Prompts are package data that never change at runtime, so all of them are
+# read at import rather than one file at a time while the chain is built.
+_PROMPTS: dict[str, str] = {
+    entry.name.removesuffix(".md"): entry.read_text(encoding="utf-8")
+    for entry in _PROMPTS_DIR.iterdir()
+    if entry.name.endswith(".md") and entry.is_file()
+}
+
+
+def _load_prompt(name: str) -> str:
+    """Return an agent's system prompt from the prompts package data."""
     try:
-        pkg = importlib.resources.files("mergeguard") / "prompts" / f"{name}.md"
-        return pkg.read_text(encoding="utf-8")
-    except (FileNotFoundError, TypeError, ModuleNotFoundError):
-        pass
-
-    # Fallback: resolve relative to this file → ../../agents/<name>.md
-    from pathlib import Path
-
-    agents_dir = Path(__file__).resolve().parent.parent.parent / "agents"
-    prompt_path = agents_dir / f"{name}.md"
-    if not prompt_path.exists():
-        raise FileNotFoundError(
-            f"Agent prompt not found. Tried importlib.resources and {prompt_path}"
-        )
-    return prompt_path.read_text(encoding="utf-8")
+        return _PROMPTS[name]
+    except KeyError:
+        raise FileNotFoundError(f"Agent prompt not found: {_PROMPTS_DIR / f'{name}.md'}") from None
 
 
 # ── Agent factories ────────────────────────────────────────────────────
 
 
-def create_planner(client: Mistral) -> object:
-    """Create the Planner agent — parses PR and builds review plan."""
-    return client.beta.agents.create(
-        model="mistral-large-latest",
-        name="MergeGuard-Planner",
-        description="Analyzes PR diffs and creates a structured review plan.",
-        instructions=_load_prompt("planner"),
-        tools=PLANNER_TOOLS,
-        completion_args=CompletionArgs(temperature=0.2),
-    )
+# Planning and reviewing used to be two agents with a handoff between them.
+# Their tool calls are independent, so one agent (prompts/plan_and_review.md)
+# issues them in parallel batches instead — saving a handoff and several
+# sequential turns.
 
+# Static per-agent settings, built once at import so each factory call only
+# adds the instructions and issues the HTTP request.
+_PLAN_AND_REVIEW_KWARGS = dict(
+    model="devstral-2512",
+    name="MergeGuard-PlanReview",
+    description="Plans the review of a PR and produces detailed review comments.",
+    tools=PLAN_AND_REVIEW_TOOLS,
+    completion_args=CompletionArgs(temperature=0.3),
+)
 
-def create_reviewer(client: Mistral) -> object:
-    """Create the Reviewer agent — performs detailed code review.
+_VERIFIER_KWARGS = dict(
+    model="devstral-2512",
+    name="MergeGuard-Verifier",
+    description="Validates review comments using code execution.",
+    tools=VERIFIER_TOOLS,
+    completion_args=CompletionArgs(temperature=0.1),
+)
 
-    Uses devstral-2512 (Mistral's frontier code model).
+_REPORTER_KWARGS = dict(
+    model="mistral-large-latest",
+    name="MergeGuard-Reporter",
+    description="Aggregates findings into a structured review report.",
+    tools=REPORTER_TOOLS,
+    completion_args=_REPORTER_COMPLETION_ARGS,
+)
+
+
+async def create_plan_and_review(client: Mistral) -> object:
+    """Create the Plan & Review agent — plans and performs the code review.
+
+    Merges the former Planner and Reviewer agents so their tool calls can
+    be batched into parallel turns. Uses devstral-2512 (Mistral's
+    frontier code model).
     """
-    return client.beta.agents.create(
-        model="devstral-2512",
-        name="MergeGuard-Reviewer",
-        description="Reviews code changes and produces detailed comments.",
-        instructions=_load_prompt("reviewer"),
-        tools=REVIEWER_TOOLS,
-        completion_args=CompletionArgs(temperature=0.3),
+    return await client.beta.agents.create_async(
+        instructions=_load_prompt("plan_and_review"),
+        **_PLAN_AND_REVIEW_KWARGS,
     )
 
 
-def create_verifier(client: Mistral) -> object:
+async def create_verifier(client: Mistral) -> object:
     """Create the Verifier agent — validates review suggestions.
 
     Uses devstral-2512 (Mistral's frontier code model).
     """
-    return client.beta.agents.create(
-        model="devstral-2512",
-        name="MergeGuard-Verifier",
-        description="Validates review comments using code execution.",
+    return await client.beta.agents.create_async(
         instructions=_load_prompt("verifier"),
-        tools=VERIFIER_TOOLS,
-        completion_args=CompletionArgs(temperature=0.1),
+        **_VERIFIER_KWARGS,
     )
 
 
-def create_reporter(client: Mistral) -> object:
+async def create_reporter(client: Mistral, batch_mode: bool = False) -> object:
     """Create the Reporter agent — produces structured JSON report.
 
     response_format is placed inside completion_args (not top-level)
     per the Mistral Agents API spec.
+
+    With ``batch_mode=True`` no online agent is created; a BatchReporter
+    is returned instead, which aggregates many PRs in one batch job.
     """
-    return client.beta.agents.create(
-        model="mistral-large-latest",
-        name="MergeGuard-Reporter",
-        description="Aggregates findings into a structured review report.",
+    if batch_mode:
+        return BatchReporter(
+            client=client,
+            instructions=_load_prompt("reporter"),
+            response_format=_REPORTER_RESPONSE_FORMAT_DICT,
+        )
+
+    return await client.beta.agents.create_async(
         instructions=_load_prompt("reporter"),
-        tools=REPORTER_TOOLS,
-        completion_args=CompletionArgs(
-            temperature=0.1,
-            response_format=ResponseFormat(
-                type="json_schema",
-                json_schema=JSONSchema(
-                    name="ReviewReport",
-                    schema=ReviewReport.model_json_schema(),
-                ),
-            ),
-        ),
+        **_REPORTER_KWARGS,
     )
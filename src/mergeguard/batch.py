@@ -0,0 +1,141 @@
+"""Batch-API path for the Reporter stage.
+
+When many PRs are reviewed in one CI run, the Reporter's aggregation step
+is independent per PR.  ``BatchReporter`` queues those aggregation requests
+and submits them as a single Mistral batch job (one upload, one job, one
+download) instead of one online Reporter turn per PR.  Batch jobs are
+billed at a discount and amortise API latency across the whole set.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mistralai import Mistral
+
+# ── Job lifecycle ──────────────────────────────────────────────────────
+
+_TERMINAL_STATUSES = frozenset({"SUCCESS", "FAILED", "TIMEOUT_EXCEEDED", "CANCELLED"})
+
+
+@dataclass
+class BatchReporter:
+    """Collects per-PR findings and turns them into reports via one batch job.
+
+    Usage::
+
+        reporter = await create_reporter(client, batch_mode=True)
+        reporter.add("owner/repo#123", findings_for_pr_123)
+        reporter.add("owner/repo#456", findings_for_pr_456)
+        reports = reporter.run(timeout=3600)  # {"owner/repo#123": {...}, ...}
+    """
+
+    client: Mistral
+    instructions: str
+    response_format: dict[str, Any]
+    model: str = "mistral-large-latest"
+    temperature: float = 0.1
+    _pending: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def add(self, custom_id: str, findings: str) -> None:
+        """Queue the Verifier's findings for one PR."""
+        self._pending[custom_id] = findings
+
+    def _to_jsonl(self) -> bytes:
+        """Serialise pending requests as batch input (one request per line)."""
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "body": {
+                        "messages": [
+                            {"role": "system", "content": self.instructions},
+                            {"role": "user", "content": findings},
+                        ],
+                        "temperature": self.temperature,
+                        "response_format": self.response_format,
+                    },
+                }
+            )
+            for custom_id, findings in self._pending.items()
+        ]
+        return "\n".join(lines).encode("utf-8")
+
+    def submit(self) -> str:
+        """Upload pending requests and start a batch job. Returns the job ID."""
+        if not self._pending:
+            raise ValueError("No pending review contexts to submit")
+
+        batch_file = self.client.files.upload(
+            file={"file_name": "mergeguard-reports.jsonl", "content": self._to_jsonl()},
+            purpose="batch",
+        )
+        job = self.client.batch.jobs.create(
+            input_files=[batch_file.id],
+            model=self.model,
+            endpoint="/v1/chat/completions",
+            metadata={"job_type": "mergeguard-reporter"},
+        )
+        self._pending.clear()
+        return job.id
+
+    def wait(self, job_id: str, poll_interval: float = 5.0, timeout: float = 3600.0) -> Any:
+        """Poll until the batch job reaches a terminal status.
+
+        If the job is still running after ``timeout`` seconds it is
+        cancelled and ``TimeoutError`` is raised.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.client.batch.jobs.get(job_id=job_id)
+            if job.status in _TERMINAL_STATUSES:
+                return job
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.client.batch.jobs.cancel(job_id=job_id)
+                raise TimeoutError(
+                    f"Batch job {job_id} still {job.status} after {timeout:g}s; cancelled"
+                )
+            time.sleep(min(poll_interval, remaining))
+
+    def results(self, job: Any) -> dict[str, dict]:
+        """Download a finished job's output and parse each report.
+
+        Returns a mapping of ``custom_id`` to the report dict, or to an
+        ``{"error": ...}`` dict for requests that failed.
+        """
+        if job.status != "SUCCESS" or not job.output_file:
+            raise RuntimeError(f"Batch job {job.id} finished with status {job.status}")
+
+        # The SDK returns the download as a streamed, still-unread response.
+        output = self.client.files.download(file_id=job.output_file)
+        try:
+            output.read()
+            text = output.text
+        finally:
+            output.close()
+
+        reports: dict[str, dict] = {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                reports[entry["custom_id"]] = {"error": entry.get("error") or response}
+                continue
+            content = response["body"]["choices"][0]["message"]["content"]
+            try:
+                reports[entry["custom_id"]] = json.loads(content)
+            except json.JSONDecodeError as e:
+                reports[entry["custom_id"]] = {"error": f"Report is not valid JSON: {e}"}
+        return reports
+
+    def run(self, poll_interval: float = 5.0, timeout: float = 3600.0) -> dict[str, dict]:
+        """Submit, wait for, and collect all pending reports."""
+        job = self.wait(self.submit(), poll_interval=poll_interval, timeout=timeout)
+        return self.results(job)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import sys
 from dataclasses import dataclass, field
 
 
@@ -14,8 +16,7 @@ DEFAULT_MODEL = "mistral-large-latest"
 DEFAULT_HANDOFF_MODE = "server"  # "server" | "client"
 
 AGENT_NAMES = {
-    "planner": "mergeguard-planner",
-    "reviewer": "mergeguard-reviewer",
+    "plan_and_review": "mergeguard-plan-and-review",
     "verifier": "mergeguard-verifier",
     "reporter": "mergeguard-reporter",
 }
@@ -36,9 +37,12 @@ class MergeGuardConfig:
     handoff_mode: str = DEFAULT_HANDOFF_MODE
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "MergeGuardConfig":
         """Build config from environment variables.
 
+        The result is cached, so the environment is read once per process.
+
         Required:
             MISTRAL_API_KEY
             GITHUB_TOKEN
@@ -58,6 +62,8 @@ class MergeGuardConfig:
         return cls(
             mistral_api_key=mistral_key,
             github_token=github_token,
-            model=os.environ.get("MERGEGUARD_MODEL", DEFAULT_MODEL),
-            handoff_mode=os.environ.get("MERGEGUARD_HANDOFF_MODE", DEFAULT_HANDOFF_MODE),
+            model=sys.intern(os.environ.get("MERGEGUARD_MODEL", DEFAULT_MODEL)),
+            handoff_mode=sys.intern(
+                os.environ.get("MERGEGUARD_HANDOFF_MODE", DEFAULT_HANDOFF_MODE)
+            ),
         )
@@ -8,31 +8,70 @@ access.
 
 from __future__ import annotations
 
-import json
+import ast
+import asyncio
+import atexit
+import base64
+import hashlib
 import os
+from collections import OrderedDict
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
 import httpx
+import orjson
 
 _GITHUB_API = "https://api.github.com"
 _TIMEOUT = 30.0
+_MAX_DIFF_BYTES = 1 << 20  # cap on diff bytes downloaded and decoded
+_MAX_PATCH_CHARS = 500  # per-file patch excerpt in list_changed_files
+
+# Headers are fixed for the process lifetime, so build them once at import
+# instead of re-reading the environment and allocating a dict per request.
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
+_BASE_HEADERS = {
+    "Authorization": f"Bearer {_GITHUB_TOKEN}",
+    "Accept": "application/vnd.github.v3+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+_DIFF_HEADERS = {"Accept": "application/vnd.github.v3.diff"}
+
+# One pooled client for the whole process so repeated tool calls reuse the
+# same TCP/TLS connection (keep-alive, HTTP/2) instead of reconnecting.
+_CLIENT = httpx.Client(
+    base_url=_GITHUB_API,
+    timeout=_TIMEOUT,
+    http2=True,
+    headers=_BASE_HEADERS,
+)
+atexit.register(_CLIENT.close)
+
+# Upper bound on in-flight requests per batch, to stay clear of GitHub's
+# secondary rate limits.
+_MAX_CONCURRENT_READS = 10
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    """Build an async client with the same settings as ``_CLIENT``.
+
+    An AsyncClient's pool is bound to the event loop that first uses it, so
+    it is not shared process-wide: each async entry point opens one with
+    ``async with`` and closes it before returning.
+    """
+    return httpx.AsyncClient(
+        base_url=_GITHUB_API,
+        timeout=_TIMEOUT,
+        http2=True,
+        headers=_CLIENT.headers,
+    )
 
 
-def _headers() -> dict[str, str]:
-    """Build GitHub API request headers.
-
-    Raises ``RuntimeError`` if ``GITHUB_TOKEN`` is not set.
-    """
-    token = os.environ.get("GITHUB_TOKEN")
-    if not token:
+def _require_token() -> None:
+    """Raise ``RuntimeError`` if ``GITHUB_TOKEN`` was not set at import."""
+    if not _GITHUB_TOKEN:
         raise RuntimeError(
             "GITHUB_TOKEN environment variable is required for GitHub API access"
         )
-    return {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
 
 
 # ── Tool implementations (sync — RunContext wraps them automatically) ──
@@ -47,15 +86,30 @@ def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
         pr_number: Pull request number.
 
     Returns:
-        The unified diff as a string.
+        The unified diff as a string, truncated to ``_MAX_DIFF_BYTES``.
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/pulls/{pr_number}"
-    headers = _headers()
-    headers["Accept"] = "application/vnd.github.v3.diff"
-    with httpx.Client(timeout=_TIMEOUT) as client:
-        resp = client.get(url, headers=headers)
+    _require_token()
+    chunks: list[bytes] = []
+    size = 0
+    truncated = False
+    # Stream so oversized diffs are never fully downloaded or decoded.
+    with _CLIENT.stream(
+        "GET",
+        f"/repos/{owner}/{repo}/pulls/{pr_number}",
+        headers=_DIFF_HEADERS,
+    ) as resp:
         resp.raise_for_status()
-        return resp.text
+        for chunk in resp.iter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _MAX_DIFF_BYTES:
+                truncated = True
+                break
+
+    diff = b"".join(chunks)[:_MAX_DIFF_BYTES].decode("utf-8", errors="replace")
+    if truncated:
+        diff += f"\n\n... [diff truncated at {_MAX_DIFF_BYTES} bytes]"
+    return diff
 
 
 def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
@@ -67,13 +121,13 @@ def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
         pr_number: Pull request number.
 
     Returns:
-        JSON string with a list of changed files and their stats.
+        JSON string with a list of changed files and their stats, each
+        with the head-commit ``ref`` to pass to ``read_file``.
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/pulls/{pr_number}/files"
-    with httpx.Client(timeout=_TIMEOUT) as client:
-        resp = client.get(url, headers=_headers())
-        resp.raise_for_status()
-        files = resp.json()
+    _require_token()
+    resp = _CLIENT.get(f"/repos/{owner}/{repo}/pulls/{pr_number}/files")
+    resp.raise_for_status()
+    files = orjson.loads(resp.content)
 
     summary = [
         {
@@ -82,11 +136,29 @@ def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
             "additions": f["additions"],
             "deletions": f["deletions"],
             "changes": f["changes"],
-            "patch": f.get("patch", "")[:500],  # truncate large patches
+            "patch": _truncate_patch(f.get("patch")),
+            "ref": _head_ref(f.get("contents_url", "")),
         }
         for f in files
     ]
-    return json.dumps(summary, indent=2)
+    # The agent does not need pretty-printing; orjson encodes this
+    # list-of-dicts several times faster than json.dumps(indent=2).
+    return orjson.dumps(summary).decode()
+
+
+def _truncate_patch(patch: str | None) -> str:
+    """Clip a file patch to ``_MAX_PATCH_CHARS``, slicing only when needed.
+
+    GitHub omits the patch (or sends null) for binary and very large files.
+    """
+    if not patch:
+        return ""
+    return patch[:_MAX_PATCH_CHARS] if len(patch) > _MAX_PATCH_CHARS else patch
+
+
+def _head_ref(contents_url: str) -> str:
+    """Extract the head commit SHA from a PR file's ``contents_url``."""
+    return parse_qs(urlsplit(contents_url).query).get("ref", [""])[0]
 
 
 def read_file(owner: str, repo: str, path: str, ref: str) -> str:
@@ -101,75 +173,158 @@ def read_file(owner: str, repo: str, path: str, ref: str) -> str:
     Returns:
         The file content as a string.
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/contents/{path}"
-    with httpx.Client(timeout=_TIMEOUT) as client:
-        resp = client.get(url, headers=_headers(), params={"ref": ref})
-        resp.raise_for_status()
-        data = resp.json()
+    _require_token()
+    resp = _CLIENT.get(
+        f"/repos/{owner}/{repo}/contents/{path}",
+        params={"ref": ref},
+    )
+    resp.raise_for_status()
+    return _decode_content(resp.json())
+
+
+async def read_file_async(
+    owner: str, repo: str, path: str, ref: str, client: httpx.AsyncClient | None = None
+) -> str:
+    """Async variant of :func:`read_file`.
+
+    Pass ``client`` to reuse its connections across calls; otherwise a
+    short-lived client is opened for this one request.
+    """
+    _require_token()
+    if client is None:
+        async with _new_async_client() as client:
+            return await read_file_async(owner, repo, path, ref, client)
+    resp = await client.get(
+        f"/repos/{owner}/{repo}/contents/{path}",
+        params={"ref": ref},
+    )
+    resp.raise_for_status()
+    return _decode_content(resp.json())
 
-    if data.get("encoding") == "base64":
-        import base64
 
+async def read_files(owner: str, repo: str, paths: list[str], ref: str) -> str:
+    """Read several files from a specific git ref concurrently.
+
+    Args:
+        owner: Repository owner.
+        repo: Repository name.
+        paths: File paths relative to repo root.
+        ref: Git ref (branch, tag, or SHA).
+
+    Returns:
+        JSON object mapping each path to its content, or to an
+        ``{"error": ...}`` object if that file could not be read.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+
+    async def _read(path: str) -> str:
+        async with semaphore:
+            return await read_file_async(owner, repo, path, ref, client)
+
+    async with _new_async_client() as client:
+        results = await asyncio.gather(*(_read(p) for p in paths), return_exceptions=True)
+    return orjson.dumps(
+        {
+            path: {"error": str(result)} if isinstance(result, Exception) else result
+            for path, result in zip(paths, results)
+        },
+        option=orjson.OPT_INDENT_2,
+    ).decode()
+
+
+def _decode_content(data: dict[str, Any]) -> str:
+    """Extract file text from a GitHub contents API payload."""
+    if data.get("encoding") == "base64":
         return base64.b64decode(data["content"]).decode("utf-8")
     return data.get("content", "")
 
 
-def check_style(code: str, language: str) -> str:
+def _scan_lines(code: str, check_tabs: bool) -> list[dict[str, Any]]:
+    """Find over-long lines (and optionally tabs), ordered by line."""
+    issues: list[dict[str, Any]] = []
+    for i, line in enumerate(code.splitlines(), 1):
+        if len(line) > 120:
+            issues.append(
+                {
+                    "type": "line_too_long",
+                    "line": i,
+                    "message": f"Line exceeds 120 characters ({len(line)})",
+                }
+            )
+        if check_tabs and "\t" in line:
+            issues.append(
+                {
+                    "type": "tabs",
+                    "line": i,
+                    "message": "Use spaces instead of tabs",
+                }
+            )
+    return issues
+
+
+# check_style is deterministic in its inputs, and the same snippet is often
+# re-checked across agent turns, so results are kept in a small LRU.
+_STYLE_CACHE: OrderedDict[tuple[bytes, str, bool], str] = OrderedDict()
+_STYLE_CACHE_SIZE = 256
+
+# Pre-encoded result for the common no-issues case.
+_CLEAN_RESULT = orjson.dumps({"status": "clean", "issues": []}).decode()
+
+
+def check_style(code: str, language: str, fast: bool = False) -> str:
     """Run basic style checks on a code snippet.
 
     Args:
         code: Code snippet to check.
         language: Programming language (python, javascript, etc.).
+        fast: Skip the Python syntax check and only run line heuristics.
 
     Returns:
         JSON string with a list of style issues found.
     """
+    if not code:  # nothing to scan or parse
+        return _CLEAN_RESULT
+
+    # Key on a digest so large snippets are not pinned in the cache.
+    digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16)
+    key = (digest.digest(), language, fast)
+    result = _STYLE_CACHE.get(key)
+    if result is not None:
+        _STYLE_CACHE.move_to_end(key)
+        return result
+
+    result = _check_style_impl(code, language, fast)
+    _STYLE_CACHE[key] = result
+    if len(_STYLE_CACHE) > _STYLE_CACHE_SIZE:
+        _STYLE_CACHE.popitem(last=False)
+    return result
+
+
+def _check_style_impl(code: str, language: str, fast: bool) -> str:
+    """Uncached body of :func:`check_style`."""
     issues: list[dict[str, Any]] = []
 
     if language.lower() == "python":
-        import ast
-
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
-            issues.append(
-                {
-                    "type": "syntax_error",
-                    "line": e.lineno,
-                    "message": str(e.msg),
-                }
-            )
-
-        # Basic style heuristics
-        for i, line in enumerate(code.splitlines(), 1):
-            if len(line) > 120:
-                issues.append(
-                    {
-                        "type": "line_too_long",
-                        "line": i,
-                        "message": f"Line exceeds 120 characters ({len(line)})",
-                    }
-                )
-            if "\t" in line:
+        if not fast:
+            try:
+                ast.parse(code)
+            except SyntaxError as e:
                 issues.append(
                     {
-                        "type": "tabs",
-                        "line": i,
-                        "message": "Use spaces instead of tabs",
+                        "type": "syntax_error",
+                        "line": e.lineno,
+                        "message": str(e.msg),
                     }
                 )
+
+        # Basic style heuristics
+        issues.extend(_scan_lines(code, check_tabs=True))
     else:
         # For non-Python languages, do basic length checks
-        for i, line in enumerate(code.splitlines(), 1):
-            if len(line) > 120:
-                issues.append(
-                    {
-                        "type": "line_too_long",
-                        "line": i,
-                        "message": f"Line exceeds 120 characters ({len(line)})",
-                    }
-                )
+        issues.extend(_scan_lines(code, check_tabs=False))
 
     if not issues:
-        return json.dumps({"status": "clean", "issues": []})
-    return json.dumps({"status": "issues_found", "issues": issues}, indent=2)
+        return _CLEAN_RESULT
+    return orjson.dumps(
+        {"status": "issues_found", "issues": issues}, option=orjson.OPT_INDENT_2
+    ).decode()
@@ -2,77 +2,105 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from mergeguard.agents import (
-    create_planner,
+    create_plan_and_review,
     create_reporter,
-    create_reviewer,
     create_verifier,
 )
 
 if TYPE_CHECKING:
     from mistralai import Mistral
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class MergeGuardChain:
-    """Holds the 4-agent chain with handoffs configured."""
+    """Holds the 3-agent chain with handoffs configured."""
 
-    planner_id: str
-    reviewer_id: str
+    plan_review_id: str
     verifier_id: str
-    reporter_id: str
-    entry_agent_id: str  # alias for planner_id — where to send user input
+    reporter_id: str | None  # None in batch mode (see BatchReporter)
+    entry_agent_id: str  # alias for plan_review_id — where to send user input
+
 
+async def build_chain_async(client: Mistral, batch_mode: bool = False) -> MergeGuardChain:
+    """Create all 3 agents and wire up the handoff chain.
 
-def build_chain(client: Mistral) -> MergeGuardChain:
-    """Create all 4 agents and wire up the handoff chain.
+    Chain: Plan & Review → Verifier → Reporter
 
-    Chain: Planner → Reviewer → Verifier → Reporter
+    The three creates are independent, as are the two handoff updates,
+    so each stage is dispatched concurrently (2 round trips instead of 5).
+    If any create or update fails, the agents that were created are
+    deleted before the error is re-raised.
+
+    With ``batch_mode=True`` no Reporter agent is created and the Verifier
+    is terminal; its output is fed to a BatchReporter instead.
 
     Returns a MergeGuardChain with all agent IDs.
     """
     # 1. Create agents
-    planner = create_planner(client)
-    reviewer = create_reviewer(client)
-    verifier = create_verifier(client)
-    reporter = create_reporter(client)
-
-    # 2. Wire handoffs: each agent hands off to the next
-    client.beta.agents.update(
-        agent_id=planner.id,
-        handoffs=[reviewer.id],
-    )
-    client.beta.agents.update(
-        agent_id=reviewer.id,
-        handoffs=[verifier.id],
-    )
-    client.beta.agents.update(
-        agent_id=verifier.id,
-        handoffs=[reporter.id],
+    creates = [create_plan_and_review(client), create_verifier(client)]
+    if not batch_mode:
+        creates.append(create_reporter(client))
+    agents = await asyncio.gather(*creates, return_exceptions=True)
+    created = [agent.id for agent in agents if not isinstance(agent, BaseException)]
+    await _raise_first_failure(client, agents, created)
+
+    # 2. Wire handoffs: each agent hands off to the next.  The last one
+    # (the Reporter, or the Verifier in batch mode) is terminal.
+    updates = await asyncio.gather(
+        *(
+            client.beta.agents.update_async(agent_id=agent.id, handoffs=[successor.id])
+            for agent, successor in zip(agents, agents[1:])
+        ),
+        return_exceptions=True,
     )
-    # Reporter is terminal — no handoff
+    await _raise_first_failure(client, updates, created)
 
     return MergeGuardChain(
-        planner_id=planner.id,
-        reviewer_id=reviewer.id,
-        verifier_id=verifier.id,
-        reporter_id=reporter.id,
-        entry_agent_id=planner.id,
+        plan_review_id=agents[0].id,
+        verifier_id=agents[1].id,
+        reporter_id=None if batch_mode else agents[2].id,
+        entry_agent_id=agents[0].id,
+    )
+
+
+async def _raise_first_failure(client: Mistral, results: list, created: list[str]) -> None:
+    """Delete ``created`` agents and re-raise if any gathered call failed."""
+    for result in results:
+        if isinstance(result, BaseException):
+            await _delete_agents(client, created)
+            raise result
+
+
+async def teardown_chain_async(client: Mistral, chain: MergeGuardChain) -> None:
+    """Delete all agents in the chain concurrently (cleanup)."""
+    await _delete_agents(
+        client,
+        [
+            agent_id
+            for agent_id in (chain.plan_review_id, chain.verifier_id, chain.reporter_id)
+            if agent_id is not None
+        ],
     )
 
 
-def teardown_chain(client: Mistral, chain: MergeGuardChain) -> None:
-    """Delete all agents in the chain (cleanup)."""
-    for agent_id in [
-        chain.planner_id,
-        chain.reviewer_id,
-        chain.verifier_id,
-        chain.reporter_id,
-    ]:
-        try:
-            client.beta.agents.delete(agent_id=agent_id)
-        except Exception:
-            pass  # best-effort cleanup
+async def _delete_agents(client: Mistral, agent_ids: list[str]) -> None:
+    """Delete agents concurrently.
+
+    Cleanup is best-effort: one failed delete does not stop the others,
+    but every failure is logged so leaked agents do not go unnoticed.
+    """
+    results = await asyncio.gather(
+        *(client.beta.agents.delete_async(agent_id=agent_id) for agent_id in agent_ids),
+        return_exceptions=True,
+    )
+    for agent_id, result in zip(agent_ids, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to delete agent %s: %s", agent_id, result)
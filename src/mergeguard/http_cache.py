@@ -0,0 +1,107 @@
+"""Response caching and body reading shared by the GitHub tool implementations.
+
+``main`` and ``tool_impl`` each talk to GitHub through their own client
+(and ``tool_impl`` through a rate limiter), but read bodies and cache
+responses the same way; both halves live here.  httpx is only needed
+for annotations, so importing this module stays cheap for the CLI.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    import httpx
+
+    # Performs the request with the given extra headers and returns the
+    # response together with its body text.
+    Send = Callable[[dict[str, str]], Awaitable[tuple[httpx.Response, str]]]
+
+
+# ── Body reading ───────────────────────────────────────────────────────
+
+
+async def read_text(resp: httpx.Response, max_bytes: int | None) -> str:
+    """Read a streamed body as UTF-8, stopping after ``max_bytes``.
+
+    Memory and decode work stay bounded by the cap however large the
+    response is; the rest of the body is never read.  When Content-Length
+    already shows the body fits under the cap, it is read in one go.
+    """
+    if max_bytes is None or _declared_length(resp) <= max_bytes:
+        await resp.aread()
+        return resp.content.decode("utf-8", errors="replace")
+
+    buf = bytearray()
+    async for chunk in resp.aiter_bytes(65536):
+        buf += chunk
+        if len(buf) >= max_bytes:
+            text = buf[:max_bytes].decode("utf-8", errors="replace")
+            return text + f"\n\n... [truncated at {max_bytes} bytes]"
+    return buf.decode("utf-8", errors="replace")
+
+
+def _declared_length(resp: httpx.Response) -> float:
+    """Decoded body size from Content-Length, or infinity if unknown.
+
+    A compressed body's Content-Length says nothing about its decoded
+    size, so encoded responses count as unknown.
+    """
+    length = resp.headers.get("Content-Length")
+    if length is None or "Content-Encoding" in resp.headers:
+        return float("inf")
+    return int(length)
+
+
+# ── Response cache ─────────────────────────────────────────────────────
+
+
+class ResponseCache:
+    """LRU of GET response bodies with a TTL and ETag revalidation.
+
+    Fresh entries are served without a request.  Stale ones are revalidated
+    with If-None-Match; a 304 reuses the cached body, costs no body
+    transfer and does not count against the REST rate limit.  Only 200
+    responses are stored.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # key -> (expires_at, etag, body, Link header)
+        self._entries: OrderedDict[Hashable, tuple[float, str, str, str]] = OrderedDict()
+
+    async def get(self, key: Hashable, send: Send) -> tuple[int, str, str]:
+        """Return ``(status_code, body, link_header)`` for ``key``.
+
+        ``send`` is only called on a miss or a stale entry.  Error
+        responses are returned as-is (with an empty Link) and not cached.
+        """
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry[0]:
+            self._entries.move_to_end(key)
+            return 200, entry[2], entry[3]
+
+        extra = {"If-None-Match": entry[1]} if entry is not None and entry[1] else {}
+        resp, text = await send(extra)
+        if resp.status_code == 304 and entry is not None:
+            etag, body, link = entry[1], entry[2], entry[3]
+        elif resp.status_code == 200:
+            etag, body, link = resp.headers.get("ETag", ""), text, resp.headers.get("Link", "")
+        else:
+            return resp.status_code, text, ""
+
+        self._entries[key] = (now + self._ttl, etag, body, link)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return 200, body, link
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
@@ -4,49 +4,132 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import functools
 import os
 import re
 import sys
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
 
-import httpx
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
+import orjson
+
+from mergeguard.http_cache import ResponseCache, read_text
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    import httpx
+    from mistralai import Mistral
+    from rich.console import Console
+
+    from mergeguard.schemas import ReviewReport
+
+
+@functools.cache
+def _console() -> Console:
+    """Lazily create the shared Rich console.
+
+    Importing Rich and probing the terminal is deferred until something is
+    actually printed, so ``mergeguard --help`` stays fast.
+    """
+    from rich.console import Console
+
+    return Console()
 
-console = Console()
 
 # ── GitHub API helper ──────────────────────────────────────────────────
 
-_github_client: httpx.Client | None = None
-
-
-def _gh_client() -> httpx.Client:
-    """Lazy-init an httpx client with GITHUB_TOKEN auth (if available)."""
-    global _github_client
-    if _github_client is None:
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        token = os.environ.get("GITHUB_TOKEN")
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        _github_client = httpx.Client(
-            base_url="https://api.github.com",
-            headers=headers,
-            timeout=30.0,
-        )
-    return _github_client
+# Read once at import: the client settings never change during a run.
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+_GH_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+if _GITHUB_TOKEN:
+    _GH_HEADERS["Authorization"] = f"Bearer {_GITHUB_TOKEN}"
+
+
+def _gh_client() -> httpx.AsyncClient:
+    """Return the async GitHub client for the running event loop.
+
+    Tool calls are awaited on the pipeline's event loop, so a non-blocking
+    client lets several GitHub requests be in flight at once.  httpx pools
+    are bound to the loop that created them, hence one client per loop.
+    """
+    return _gh_client_for(asyncio.get_running_loop())
+
+
+@functools.cache
+def _gh_client_for(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    """Build the client for ``loop`` (cached; cleared by :func:`_close_gh_client`)."""
+    import httpx
+
+    return httpx.AsyncClient(
+        base_url="https://api.github.com",
+        headers=_GH_HEADERS,
+        timeout=30.0,
+        http2=True,
+        # Keep idle connections for a minute: the model often thinks for
+        # several seconds between tool calls, longer than httpx's 5s default.
+        limits=httpx.Limits(
+            max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+        ),
+    )
+
+
+async def _close_gh_client() -> None:
+    """Close the GitHub client of the running loop and forget it."""
+    for task in _file_reads.values():
+        task.cancel()
+    _file_reads.clear()
+    if _gh_client_for.cache_info().currsize:
+        await _gh_client().aclose()
+    _gh_client_for.cache_clear()
+
+
+# The Plan & Review agent often asks for the same diff or file again within
+# one review (re-reading a file it planned from, or one the prefetch already
+# fetched), so GET responses go through a small TTL/ETag cache.
+_MAX_DIFF_BYTES = 1 << 20  # keep the diff within the LLM context budget
+_response_cache = ResponseCache(ttl=300.0, maxsize=256)
+
+
+async def _cached_get(
+    path: str,
+    *,
+    params: dict[str, str] | None = None,
+    accept: str | None = None,
+    max_bytes: int | None = None,
+) -> tuple[int, str]:
+    """GET a GitHub API path through the response cache.
+
+    Successful bodies are streamed and, if ``max_bytes`` is set, cut off
+    once that many bytes have arrived (see :func:`read_text`).
+
+    Returns ``(status_code, body)``.  Only 200 responses are cached.
+    """
+
+    async def send(extra: dict[str, str]) -> tuple[httpx.Response, str]:
+        headers = {"Accept": accept, **extra} if accept else extra
+        async with _gh_client().stream("GET", path, params=params, headers=headers) as resp:
+            if resp.status_code == 200:
+                return resp, await read_text(resp, max_bytes)
+            await resp.aread()
+            return resp, resp.text
+
+    key = (path, accept, tuple(sorted((params or {}).items())))
+    status, body, _ = await _response_cache.get(key, send)
+    return status, body
 
 
 # ── PR URL parsing ─────────────────────────────────────────────────────
 
+_PR_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
 
 def parse_pr_url(url: str) -> tuple[str, str, int]:
     """Extract owner, repo, and PR number from a GitHub PR URL.
 
     Supports: https://github.com/owner/repo/pull/123
     """
-    pattern = r"github\.com/([^/]+)/([^/]+)/pull/(\d+)"
-    match = re.search(pattern, url)
+    match = _PR_URL_RE.search(url)
     if not match:
         raise ValueError(f"Invalid GitHub PR URL: {url}")
     return match.group(1), match.group(2), int(match.group(3))
@@ -55,23 +138,28 @@ def parse_pr_url(url: str) -> tuple[str, str, int]:
 # ── Tool implementations ──────────────────────────────────────────────
 
 
-def _fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
+async def _fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
     """Fetch the unified diff for a GitHub Pull Request."""
-    gh = _gh_client()
-    resp = gh.get(
+    status, body = await _cached_get(
         f"/repos/{owner}/{repo}/pulls/{pr_number}",
-        headers={"Accept": "application/vnd.github.v3.diff"},
+        accept="application/vnd.github.v3.diff",
+        max_bytes=_MAX_DIFF_BYTES,
     )
-    if resp.status_code == 200:
-        return resp.text
-    return json.dumps({"error": f"GitHub API returned {resp.status_code}", "body": resp.text[:500]})
+    if status == 200:
+        return body
+    return orjson.dumps(
+        {"error": f"GitHub API returned {status}", "body": body[:500]}
+    ).decode()
 
 
-def _list_changed_files(owner: str, repo: str, pr_number: int) -> str:
-    """List all files changed in a GitHub Pull Request."""
-    gh = _gh_client()
-    resp = gh.get(f"/repos/{owner}/{repo}/pulls/{pr_number}/files")
-    if resp.status_code == 200:
+async def _list_changed_files(owner: str, repo: str, pr_number: int) -> str:
+    """List all files changed in a GitHub Pull Request.
+
+    The Plan & Review agent reads most of these files next, so their
+    contents are prefetched in the background while it is still planning.
+    """
+    status, body = await _cached_get(f"/repos/{owner}/{repo}/pulls/{pr_number}/files")
+    if status == 200:
         files = [
             {
                 "filename": f["filename"],
@@ -79,28 +167,141 @@ def _list_changed_files(owner: str, repo: str, pr_number: int) -> str:
                 "additions": f["additions"],
                 "deletions": f["deletions"],
                 "changes": f["changes"],
+                "ref": _head_ref(f.get("contents_url", "")),
             }
-            for f in resp.json()
+            for f in orjson.loads(body)
         ]
-        return json.dumps(files)
-    return json.dumps({"error": f"GitHub API returned {resp.status_code}"})
+        _prefetch_files(owner, repo, files)
+        return orjson.dumps(files).decode()
+    return orjson.dumps({"error": f"GitHub API returned {status}"}).decode()
 
 
-def _read_file(owner: str, repo: str, path: str, ref: str) -> str:
-    """Read the full content of a file from a specific ref."""
-    gh = _gh_client()
-    resp = gh.get(
+def _head_ref(contents_url: str) -> str:
+    """Extract the head commit SHA from a PR file's ``contents_url``."""
+    return parse_qs(urlsplit(contents_url).query).get("ref", [""])[0]
+
+
+# In-flight and just-finished file reads, keyed by (owner, repo, path, ref).
+# A read_file for a path that is already being fetched — typically by the
+# prefetch above — awaits that task instead of issuing a second request.
+_MAX_CONCURRENT_READS = 10  # stay clear of GitHub secondary rate limits
+# The prefetch is speculative, so bound what it may download: the first
+# files of the PR only, skipping huge (typically generated) changes.
+_MAX_PREFETCH_FILES = 30
+_MAX_PREFETCH_CHANGES = 2000
+_file_reads: dict[tuple[str, str, str, str], asyncio.Task[str]] = {}
+
+
+def _prefetch_files(owner: str, repo: str, files: list[dict]) -> None:
+    """Start background reads for files that exist at the PR head.
+
+    At most ``_MAX_PREFETCH_FILES`` are read, and files with more than
+    ``_MAX_PREFETCH_CHANGES`` changed lines are left to an explicit read.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+    started = 0
+    for f in files:
+        if started == _MAX_PREFETCH_FILES:
+            break
+        if f["ref"] and f["status"] != "removed" and f["changes"] <= _MAX_PREFETCH_CHANGES:
+            _file_read_task(owner, repo, f["filename"], f["ref"], semaphore)
+            started += 1
+
+
+def _file_read_task(
+    owner: str,
+    repo: str,
+    path: str,
+    ref: str,
+    semaphore: asyncio.Semaphore | None = None,
+) -> asyncio.Task[str]:
+    """Return the task reading ``path@ref``, starting one if none is running."""
+    key = (owner, repo, path, ref)
+    task = _file_reads.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_file(owner, repo, path, ref, semaphore))
+        _file_reads[key] = task
+        task.add_done_callback(functools.partial(_forget_read, key))
+    return task
+
+
+def _forget_read(key: tuple[str, str, str, str], task: asyncio.Task[str]) -> None:
+    """Drop a finished read; the response cache serves any later request."""
+    if _file_reads.get(key) is task:
+        del _file_reads[key]
+    if not task.cancelled():
+        task.exception()  # prefetches nobody awaited must not warn on GC
+
+
+async def _fetch_file(
+    owner: str, repo: str, path: str, ref: str, semaphore: asyncio.Semaphore | None
+) -> str:
+    """Read one file, holding ``semaphore`` (if given) for the request."""
+    if semaphore is None:
+        return await _get_file(owner, repo, path, ref)
+    async with semaphore:
+        return await _get_file(owner, repo, path, ref)
+
+
+class _GitHubError(Exception):
+    """A GitHub request answered with a non-200 status."""
+
+
+async def _get_file(owner: str, repo: str, path: str, ref: str) -> str:
+    """GET a file's raw content through the response cache.
+
+    Raises ``_GitHubError`` for error responses, so callers can tell a
+    failed read from file content.
+    """
+    status, body = await _cached_get(
         f"/repos/{owner}/{repo}/contents/{path}",
         params={"ref": ref},
-        headers={"Accept": "application/vnd.github.v3.raw"},
+        accept="application/vnd.github.v3.raw",
+    )
+    if status == 200:
+        return body
+    raise _GitHubError(f"GitHub API returned {status}")
+
+
+async def _read_file(owner: str, repo: str, path: str, ref: str) -> str:
+    """Read the full content of a file from a specific ref."""
+    try:
+        # Shielded so that a cancelled tool call does not abort a read that a
+        # concurrent caller (or the prefetch) is also waiting on.
+        return await asyncio.shield(_file_read_task(owner, repo, path, ref))
+    except _GitHubError as e:
+        return orjson.dumps({"error": str(e)}).decode()
+
+
+async def _read_files(owner: str, repo: str, paths: list[str], ref: str) -> str:
+    """Read several files from a specific ref concurrently.
+
+    A path that fails maps to an ``{"error": ...}`` object instead of
+    failing the whole call.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+    tasks = [_file_read_task(owner, repo, p, ref, semaphore) for p in paths]
+    results = await asyncio.gather(
+        *(asyncio.shield(t) for t in tasks), return_exceptions=True
     )
-    if resp.status_code == 200:
-        return resp.text
-    return json.dumps({"error": f"GitHub API returned {resp.status_code}"})
+    return orjson.dumps(
+        {
+            path: {"error": str(result) or type(result).__name__}
+            if isinstance(result, BaseException)
+            else result
+            for path, result in zip(paths, results)
+        }
+    ).decode()
 
 
+@functools.lru_cache(maxsize=64)
 def _check_style(code: str, language: str) -> str:
-    """Run basic style checks on a code snippet."""
+    """Run basic style checks on a code snippet.
+
+    Memoized: the Plan & Review agent often re-checks the same file across
+    turns, and ``ast.parse`` dominates the cost on large files.  The result is a pure
+    function of the inputs and an immutable string, so sharing it is safe.
+    """
     issues: list[dict] = []
     if language == "python":
         import ast
@@ -113,149 +314,292 @@ def _check_style(code: str, language: str) -> str:
         for i, line in enumerate(code.splitlines(), 1):
             if len(line) > 120:
                 issues.append({"type": "line_too_long", "line": i, "length": len(line)})
-    return json.dumps({"language": language, "issues": issues, "count": len(issues)})
+    return orjson.dumps(
+        {"language": language, "issues": issues, "count": len(issues)}
+    ).decode()
 
 
 # ── Review pipeline (async with RunContext) ────────────────────────────
 
 
-async def run_review_async(pr_url: str) -> dict:
+def _mistral_client() -> Mistral:
+    """Create the Mistral client, exiting if no API key is configured."""
+    from mistralai import Mistral
+
+    api_key = os.environ.get("MISTRAL_API_KEY")
+    if not api_key:
+        _console().print("[red]Error:[/] MISTRAL_API_KEY environment variable not set")
+        sys.exit(1)
+    return Mistral(api_key=api_key)
+
+
+async def _run_conversation(
+    client: Mistral, agent_id: str, owner: str, repo: str, pr_number: int
+) -> str:
+    """Run one PR through the agent chain starting at ``agent_id``.
+
+    Returns the content of the last agent's final message.
+    """
+    from mistralai.extra.run.context import RunContext
+
+    console = _console()
+    user_message = (
+        f"Please review this Pull Request: "
+        f"https://github.com/{owner}/{repo}/pull/{pr_number}"
+    )
+
+    async with RunContext(agent_id=agent_id) as run_ctx:
+        # Register all function tools so the SDK can execute them
+        # when agents invoke tool calls during the conversation.
+
+        @run_ctx.register_func
+        async def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
+            """Fetch the unified diff for a GitHub Pull Request.
+
+            Args:
+                owner: Repository owner (user or org).
+                repo: Repository name.
+                pr_number: Pull request number.
+            """
+            console.print(f"  [dim]→ fetch_pr_diff({owner}/{repo}#{pr_number})[/]")
+            return await _fetch_pr_diff(owner, repo, pr_number)
+
+        @run_ctx.register_func
+        async def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
+            """List all files changed in a GitHub Pull Request.
+
+            Args:
+                owner: Repository owner (user or org).
+                repo: Repository name.
+                pr_number: Pull request number.
+            """
+            console.print(f"  [dim]→ list_changed_files({owner}/{repo}#{pr_number})[/]")
+            return await _list_changed_files(owner, repo, pr_number)
+
+        @run_ctx.register_func
+        async def read_file(owner: str, repo: str, path: str, ref: str) -> str:
+            """Read the full content of a file from the PR's head branch.
+
+            Args:
+                owner: Repository owner.
+                repo: Repository name.
+                path: File path relative to repo root.
+                ref: Git ref (branch, tag, or SHA).
+            """
+            console.print(f"  [dim]→ read_file({owner}/{repo}/{path}@{ref})[/]")
+            return await _read_file(owner, repo, path, ref)
+
+        @run_ctx.register_func
+        async def read_files(owner: str, repo: str, paths: list[str], ref: str) -> str:
+            """Read several files from the PR's head branch in one call.
+
+            Args:
+                owner: Repository owner.
+                repo: Repository name.
+                paths: File paths relative to repo root.
+                ref: Git ref (branch, tag, or SHA).
+            """
+            console.print(f"  [dim]→ read_files({owner}/{repo}, {len(paths)} files @{ref})[/]")
+            return await _read_files(owner, repo, paths, ref)
+
+        @run_ctx.register_func
+        def check_style(code: str, language: str) -> str:
+            """Run basic style checks on a code snippet.
+
+            Args:
+                code: Code snippet to check.
+                language: Programming language (python, javascript, etc.).
+            """
+            console.print(f"  [dim]→ check_style(lang={language}, {len(code)} chars)[/]")
+            return _check_style(code, language)
+
+        # Run the conversation — the SDK handles function call loops
+        # and handoffs between agents automatically, awaiting the tool
+        # calls of a single turn concurrently.
+        run_result = await client.beta.conversations.run_async(
+            run_ctx=run_ctx,
+            inputs=user_message,
+        )
+
+    return run_result.outputs[-1].content
+
+
+async def run_review_async(pr_url: str) -> ReviewReport:
     """Run the full MergeGuard review pipeline on a PR.
 
     Uses the Mistral RunContext + run_async pattern for function-call
     execution and multi-agent handoffs.
 
-    Returns the ReviewReport as a dict.
+    Returns the validated ReviewReport.
     """
-    from mistralai import Mistral
-    from mistralai.extra.run.context import RunContext
+    console = _console()
 
-    from mergeguard.handoffs import build_chain, teardown_chain
-
-    # Parse PR URL
+    # Parse PR URL before importing the SDK, so bad input fails fast
     owner, repo, pr_number = parse_pr_url(pr_url)
+
+    from mergeguard.handoffs import build_chain_async, teardown_chain_async
+    from mergeguard.schemas import ReviewReport
+
     console.print(
         f"[bold blue]MergeGuard[/] reviewing "
         f"[green]{owner}/{repo}[/] PR [yellow]#{pr_number}[/]"
     )
 
-    # Initialize Mistral client
-    api_key = os.environ.get("MISTRAL_API_KEY")
-    if not api_key:
-        console.print("[red]Error:[/] MISTRAL_API_KEY environment variable not set")
-        sys.exit(1)
-
-    client = Mistral(api_key=api_key)
+    client = _mistral_client()
 
     # Build the agent chain
     console.print("[dim]Creating agent chain...[/]")
-    chain = build_chain(client)
+    chain = await build_chain_async(client)
     console.print(
-        f"[dim]Chain ready: Planner({chain.planner_id[:8]}) → "
-        f"Reviewer({chain.reviewer_id[:8]}) → "
+        f"[dim]Chain ready: PlanReview({chain.plan_review_id[:8]}) → "
         f"Verifier({chain.verifier_id[:8]}) → "
         f"Reporter({chain.reporter_id[:8]})[/]"
     )
 
     try:
-        # Start conversation with the Planner (entry agent) using RunContext
+        # Start conversation with the Plan & Review agent (entry) using RunContext
         console.print("[bold]Starting review...[/]\n")
-
-        user_message = (
-            f"Please review this Pull Request: "
-            f"https://github.com/{owner}/{repo}/pull/{pr_number}"
+        content = await _run_conversation(
+            client, chain.entry_agent_id, owner, repo, pr_number
         )
 
-        async with RunContext(agent_id=chain.entry_agent_id) as run_ctx:
-            # Register all function tools so the SDK can execute them
-            # when agents invoke tool calls during the conversation.
-
-            @run_ctx.register_func
-            def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
-                """Fetch the unified diff for a GitHub Pull Request.
-
-                Args:
-                    owner: Repository owner (user or org).
-                    repo: Repository name.
-                    pr_number: Pull request number.
-                """
-                console.print(f"  [dim]→ fetch_pr_diff({owner}/{repo}#{pr_number})[/]")
-                return _fetch_pr_diff(owner, repo, pr_number)
-
-            @run_ctx.register_func
-            def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
-                """List all files changed in a GitHub Pull Request.
-
-                Args:
-                    owner: Repository owner (user or org).
-                    repo: Repository name.
-                    pr_number: Pull request number.
-                """
-                console.print(f"  [dim]→ list_changed_files({owner}/{repo}#{pr_number})[/]")
-                return _list_changed_files(owner, repo, pr_number)
-
-            @run_ctx.register_func
-            def read_file(owner: str, repo: str, path: str, ref: str) -> str:
-                """Read the full content of a file from the PR's head branch.
-
-                Args:
-                    owner: Repository owner.
-                    repo: Repository name.
-                    path: File path relative to repo root.
-                    ref: Git ref (branch, tag, or SHA).
-                """
-                console.print(f"  [dim]→ read_file({owner}/{repo}/{path}@{ref})[/]")
-                return _read_file(owner, repo, path, ref)
-
-            @run_ctx.register_func
-            def check_style(code: str, language: str) -> str:
-                """Run basic style checks on a code snippet.
-
-                Args:
-                    code: Code snippet to check.
-                    language: Programming language (python, javascript, etc.).
-                """
-                console.print(f"  [dim]→ check_style(lang={language}, {len(code)} chars)[/]")
-                return _check_style(code, language)
-
-            # Run the conversation — the SDK handles function call loops
-            # and handoffs between agents automatically.
-            run_result = await client.beta.conversations.run_async(
-                run_ctx=run_ctx,
-                inputs=user_message,
-            )
-
-        # Parse the final JSON report from the Reporter
-        report = json.loads(run_result.outputs[-1].content)
-        return report
+        # Parse and validate the Reporter's JSON in one pydantic-core pass
+        return ReviewReport.model_validate_json(content)
 
     finally:
         # Cleanup agents
         console.print("\n[dim]Cleaning up agents...[/]")
-        teardown_chain(client, chain)
+        await teardown_chain_async(client, chain)
+        await _close_gh_client()
+
+
+async def run_batch_review_async(
+    pr_urls: list[str], timeout: float = 3600.0
+) -> dict[str, ReviewReport | str]:
+    """Review several PRs, generating all their reports in one batch job.
+
+    Each PR runs through Plan & Review → Verifier online (concurrently);
+    the Verifier's findings are then queued on a BatchReporter, which
+    turns them into reports with a single Mistral batch job.
+
+    Returns a mapping of PR URL to its ReviewReport, or to an error
+    message for PRs that failed at any stage.
+    """
+    console = _console()
+    targets = {url: parse_pr_url(url) for url in pr_urls}
+
+    from pydantic import ValidationError
+
+    from mergeguard.agents import create_reporter
+    from mergeguard.handoffs import build_chain_async, teardown_chain_async
+    from mergeguard.schemas import ReviewReport
+
+    console.print(f"[bold blue]MergeGuard[/] batch-reviewing [yellow]{len(targets)}[/] PRs")
+
+    client = _mistral_client()
+
+    console.print("[dim]Creating agent chain...[/]")
+    chain = await build_chain_async(client, batch_mode=True)
+    console.print(
+        f"[dim]Chain ready: PlanReview({chain.plan_review_id[:8]}) → "
+        f"Verifier({chain.verifier_id[:8]}) → batch Reporter[/]"
+    )
+
+    results: dict[str, ReviewReport | str] = {}
+    try:
+        console.print("[bold]Starting reviews...[/]\n")
+        findings = await asyncio.gather(
+            *(
+                _run_conversation(client, chain.entry_agent_id, *target)
+                for target in targets.values()
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        console.print("\n[dim]Cleaning up agents...[/]")
+        await teardown_chain_async(client, chain)
+        await _close_gh_client()
+
+    reporter = await create_reporter(client, batch_mode=True)
+    for url, result in zip(targets, findings):
+        if isinstance(result, BaseException):
+            results[url] = f"Review failed: {result}"
+        else:
+            reporter.add(url, result)
+
+    if len(results) < len(targets):
+        console.print("[dim]Submitting batch report job...[/]")
+        # BatchReporter polls with the sync client; keep the loop free.
+        try:
+            reports = await asyncio.to_thread(reporter.run, timeout=timeout)
+        except (RuntimeError, TimeoutError) as e:
+            # The job as a whole failed; the online reviews' errors still stand.
+            reports = {url: {"error": str(e)} for url in targets if url not in results}
+        for url, report in reports.items():
+            if isinstance(report, dict) and "error" in report:
+                results[url] = f"Report failed: {report['error']}"
+                continue
+            try:
+                results[url] = ReviewReport.model_validate(report)
+            except ValidationError as e:
+                results[url] = f"Invalid report: {e}"
+
+    return {url: results.get(url, "No report returned") for url in targets}
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` to completion on a fresh event loop.
+
+    Uses uvloop when it is installed (not available on Windows), which
+    cuts per-task scheduling overhead for the many small I/O callbacks.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
-def run_review(pr_url: str) -> dict:
+def run_review(pr_url: str) -> ReviewReport:
     """Synchronous wrapper around the async review pipeline."""
-    return asyncio.run(run_review_async(pr_url))
+    return _run(run_review_async(pr_url))
+
+
+def run_batch_review(
+    pr_urls: list[str], timeout: float = 3600.0
+) -> dict[str, ReviewReport | str]:
+    """Synchronous wrapper around :func:`run_batch_review_async`."""
+    return _run(run_batch_review_async(pr_urls, timeout))
 
 
 # ── Display ────────────────────────────────────────────────────────────
 
+# Keyed by Severity value; the report is validated, so every key is present.
+_SEV_COLORS: dict[str, str] = {
+    "critical": "red bold",
+    "warning": "yellow",
+    "suggestion": "cyan",
+    "nitpick": "dim",
+}
+
 
-def display_report(report: dict) -> None:
+def display_report(report: ReviewReport) -> None:
     """Pretty-print the review report."""
+    from rich.markup import escape
+    from rich.panel import Panel
+
+    console = _console()
     console.print()
     console.print(
         Panel(
-            report.get("summary", "No summary"),
+            escape(report.summary),
             title="[bold]Review Summary[/]",
             border_style="blue",
         )
     )
 
-    score = report.get("overall_score", 0)
-    rec = report.get("recommendation", "unknown")
+    score = report.overall_score
+    rec = report.recommendation
     score_color = "green" if score >= 80 else "yellow" if score >= 50 else "red"
     rec_color = "green" if rec == "approve" else "red"
 
@@ -264,32 +608,62 @@ def display_report(report: dict) -> None:
         f"Recommendation: [{rec_color}]{rec}[/]\n"
     )
 
-    comments = report.get("comments", [])
+    comments = report.comments
     if comments:
         console.print(f"[bold]Comments ({len(comments)}):[/]\n")
+        # Build all comment lines first and print once — each print call
+        # re-parses markup and flushes the terminal.  Model-written text is
+        # escaped so a stray "[bold]" cannot style the lines joined after it.
+        lines: list[str] = []
         for c in comments:
-            sev = c.get("severity", "info")
-            sev_colors = {
-                "critical": "red bold",
-                "warning": "yellow",
-                "suggestion": "cyan",
-                "nitpick": "dim",
-            }
-            color = sev_colors.get(sev, "white")
-            console.print(
-                f"  [{color}][{sev.upper()}][/] "
-                f"{c.get('file', '?')}:{c.get('line', '?')} — "
-                f"{c.get('message', '')}"
+            sev = c.severity.value
+            lines.append(
+                f"  [{_SEV_COLORS[sev]}][{sev.upper()}][/] "
+                f"{escape(c.file)}:{c.line} — {escape(c.message)}"
             )
-            if c.get("suggestion"):
-                console.print(f"    [dim]→ {c['suggestion']}[/]")
+            if c.suggestion:
+                lines.append(f"    [dim]→ {escape(c.suggestion)}[/]")
+        console.print("\n".join(lines))
     else:
         console.print("[green]No issues found — clean PR! 🎉[/]")
 
 
+def _display_batch(results: dict[str, ReviewReport | str], as_json: bool) -> None:
+    """Print every PR's report (or error) from a batch run."""
+    from rich.markup import escape
+
+    console = _console()
+    if as_json:
+        console.print_json(
+            orjson.dumps(
+                {
+                    url: r if isinstance(r, str) else r.model_dump(mode="json")
+                    for url, r in results.items()
+                }
+            ).decode()
+        )
+        return
+
+    for url, result in results.items():
+        console.rule(escape(url))
+        if isinstance(result, str):
+            console.print(f"[red]Error:[/] {escape(result)}")
+        else:
+            display_report(result)
+
+
 # ── CLI ────────────────────────────────────────────────────────────────
 
 
+def _pr_url_arg(value: str) -> str:
+    """argparse ``type=`` hook: reject malformed PR URLs before any API call."""
+    try:
+        parse_pr_url(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+    return value
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -298,29 +672,52 @@ def main() -> None:
     )
     parser.add_argument(
         "pr_url",
-        help="GitHub PR URL (e.g., https://github.com/owner/repo/pull/123)",
+        nargs="+",
+        type=_pr_url_arg,
+        help="GitHub PR URL (e.g., https://github.com/owner/repo/pull/123); "
+        "several URLs require --batch",
     )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Output raw JSON report instead of formatted display",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate the reports for all PRs in one Mistral batch job "
+        "(discounted, but results take minutes rather than seconds)",
+    )
+    parser.add_argument(
+        "--batch-timeout",
+        type=float,
+        default=3600.0,
+        metavar="SECONDS",
+        help="Cancel the batch job if it has not finished after this long "
+        "(default: %(default)g)",
+    )
 
     args = parser.parse_args()
+    if len(args.pr_url) > 1 and not args.batch:
+        parser.error("reviewing several PRs requires --batch")
 
     try:
-        report = run_review(args.pr_url)
+        if args.batch:
+            _display_batch(run_batch_review(args.pr_url, args.batch_timeout), args.json)
+            return
+
+        report = run_review(args.pr_url[0])
 
         if args.json:
-            console.print_json(json.dumps(report, indent=2))
+            _console().print_json(report.model_dump_json(indent=2))
         else:
             display_report(report)
 
-    except ValueError as e:
-        console.print(f"[red]Error:[/] {e}")
+    except (ValueError, TimeoutError) as e:
+        _console().print(f"[red]Error:[/] {e}")
         sys.exit(1)
     except KeyboardInterrupt:
-        console.print("\n[yellow]Review cancelled.[/]")
+        _console().print("\n[yellow]Review cancelled.[/]")
         sys.exit(130)
 
 
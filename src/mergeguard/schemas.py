@@ -60,12 +60,21 @@ class ReviewReport(BaseModel):
     )
     stats: ReviewStats = Field(default_factory=ReviewStats)
 
-    def to_json_schema(self) -> dict:
-        """Return JSON schema for use with Mistral response_format."""
-        return {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "ReviewReport",
-                "schema": self.model_json_schema(),
-            },
-        }
+    @classmethod
+    def to_json_schema(cls) -> dict:
+        """Return JSON schema for use with Mistral response_format.
+
+        The schema is generated once at import; the returned dict is shared,
+        so callers must not mutate it.
+        """
+        return _REVIEW_REPORT_SCHEMA
+
+
+# The model tree is static, so walk it for the schema only once.
+_REVIEW_REPORT_SCHEMA: dict = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ReviewReport",
+        "schema": ReviewReport.model_json_schema(),
+    },
+}
@@ -1,9 +1,10 @@
 """Client-side function implementations for MergeGuard tools.
 
 These functions are registered with RunContext so the Mistral Conversations
-API can invoke them when agents make function calls.  Each function hits
-the GitHub REST API using httpx and returns a plain string result that
-gets sent back to the agent as a FunctionResultEntry.
+API can invoke them when agents make function calls.  The GitHub-backed
+tools are coroutines sharing one pooled ``httpx.AsyncClient``, so tool
+calls issued in the same turn run concurrently.  Each returns a plain
+string result that gets sent back to the agent as a FunctionResultEntry.
 
 Requires GITHUB_TOKEN environment variable for authenticated requests
 (higher rate limits and access to private repos).
@@ -11,35 +12,193 @@ Requires GITHUB_TOKEN environment variable for authenticated requests
 
 from __future__ import annotations
 
-import json
+import ast
+import asyncio
+import functools
+import hashlib
+import multiprocessing
 import os
+import re
 import textwrap
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
 
 import httpx
+import orjson
+
+from mergeguard.http_cache import ResponseCache, read_text
 
 # ── GitHub HTTP client ─────────────────────────────────────────────────
 
 _GITHUB_API = "https://api.github.com"
 
 
-def _gh_headers() -> dict[str, str]:
-    """Build GitHub API request headers with optional auth."""
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "MergeGuard/0.1",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+# Request headers never change during a run, so build them once at import.
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+_BASE_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "MergeGuard/0.1",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+if _GITHUB_TOKEN:
+    _BASE_HEADERS["Authorization"] = f"Bearer {_GITHUB_TOKEN}"
+
+# Per-request overrides; the client merges them with _BASE_HEADERS.
+_DIFF_HEADERS = {"Accept": "application/vnd.github.v3.diff"}
+_RAW_HEADERS = {"Accept": "application/vnd.github.v3.raw"}
+
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazy-init the shared GitHub client (HTTP/2, pooled connections).
+
+    Created on first use so it binds to the event loop running the tools.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=_GITHUB_API,
+            headers=_BASE_HEADERS,
+            http2=True,
+            # Fail fast on an unreachable host; allow slow large bodies.
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # Agent turns often take longer than httpx's 5s idle expiry,
+            # which would otherwise cost a new TLS handshake per tool call.
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=50, keepalive_expiry=60.0
+            ),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared GitHub client; call before the event loop ends."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# ── Rate limiting ──────────────────────────────────────────────────────
+#
+# Concurrent fan-out (read_files) easily trips GitHub's secondary rate
+# limit, which answers with 403 + Retry-After and stalls for seconds.
+# Requests therefore draw from a token bucket, and a rate-limit response
+# pauses the whole bucket rather than just the request that saw it.
+
+
+class _TokenBucket:
+    """Async token bucket allowing ``rate`` requests per ``period`` seconds."""
 
+    def __init__(self, rate: int, period: float) -> None:
+        self._rate = rate
+        self._period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
 
-def _gh_diff_headers() -> dict[str, str]:
-    """Headers for fetching diffs (Accept: diff media type)."""
-    headers = _gh_headers()
-    headers["Accept"] = "application/vnd.github.v3.diff"
-    return headers
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the next ``seconds``."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:  # waiters are served in arrival order
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                elapsed = now - self._updated
+                self._tokens = min(self._rate, self._tokens + elapsed * self._rate / self._period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._period / self._rate)
+
+
+_limiter = _TokenBucket(rate=80, period=60.0)
+
+
+async def _gh_get(
+    path: str, *, max_bytes: int | None = None, **kwargs
+) -> tuple[httpx.Response, str]:
+    """GET ``path`` through the rate limiter, retrying once on Retry-After.
+
+    Returns the response together with its body text.  Successful bodies
+    are streamed and, if ``max_bytes`` is set, cut off once that many
+    bytes have arrived (see :func:`read_text`).
+    """
+    for attempt in range(2):
+        await _limiter.acquire()
+        async with _get_client().stream("GET", path, **kwargs) as resp:
+            if resp.is_success:
+                body = await read_text(resp, max_bytes)
+            else:
+                await resp.aread()
+                body = resp.text
+        if attempt or resp.status_code not in (403, 429) or "retry-after" not in resp.headers:
+            break
+        _limiter.pause(float(resp.headers["retry-after"]))
+    if resp.headers.get("x-ratelimit-remaining") == "0":
+        reset = float(resp.headers.get("x-ratelimit-reset", 0))
+        _limiter.pause(reset - time.time())
+    return resp, body
+
+
+# ── Response cache ─────────────────────────────────────────────────────
+#
+# The Plan & Review agent re-requests the same diff and files across turns
+# of one conversation.  Bodies are kept for a short TTL; once stale they are
+# revalidated with If-None-Match, and a 304 reuses the cached body.
+
+_cache = ResponseCache(ttl=60.0, maxsize=512)
+# Large bodies are cut off to avoid blowing the agents' context windows
+_MAX_DIFF_BYTES = 120_000
+_MAX_FILE_BYTES = 80_000
+
+
+async def _cached_get(
+    path: str,
+    *,
+    params: dict | None = None,
+    headers: dict[str, str] | None = None,
+    max_bytes: int | None = None,
+) -> str:
+    """GET ``path`` through the TTL/ETag cache and return the body text.
+
+    Raises ``httpx.HTTPStatusError`` for error responses (never cached).
+    """
+    body, _ = await _cached_fetch(path, params=params, headers=headers, max_bytes=max_bytes)
+    return body
+
+
+async def _cached_fetch(
+    path: str,
+    *,
+    params: dict | None = None,
+    headers: dict[str, str] | None = None,
+    max_bytes: int | None = None,
+) -> tuple[str, str]:
+    """Like :func:`_cached_get`, but return ``(body, link_header)``."""
+
+    async def send(extra: dict[str, str]) -> tuple[httpx.Response, str]:
+        resp, text = await _gh_get(
+            path, max_bytes=max_bytes, params=params, headers={**(headers or {}), **extra}
+        )
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return resp, text
+
+    key = (path, tuple((headers or {}).items()), tuple(sorted((params or {}).items())))
+    _, body, link = await _cache.get(key, send)
+    return body, link
 
 
 # ── Tool implementations ───────────────────────────────────────────────
@@ -48,10 +207,12 @@ def _gh_diff_headers() -> dict[str, str]:
 #   - Parameter names and types match the JSON schema in tools.py
 #   - Docstrings follow Google format so RunContext.register_func()
 #     can auto-parse descriptions and parameter docs
-#   - Return type is always str (serialised for the agent)
+#   - Return type is always str (serialised for the agent); RunContext
+#     JSON-encodes any other type, so bytes cannot be passed through.
+#     JSON results are compact: indentation only costs bytes and tokens.
 
 
-def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
+async def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
     """Fetch the unified diff for a GitHub Pull Request.
 
     Args:
@@ -59,19 +220,18 @@ def fetch_pr_diff(owner: str, repo: str, pr_number: int) -> str:
         repo: Repository name
         pr_number: Pull request number
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/pulls/{pr_number}"
-    with httpx.Client(timeout=30) as http:
-        resp = http.get(url, headers=_gh_diff_headers())
-        resp.raise_for_status()
-    diff = resp.text
-    # Truncate very large diffs to avoid blowing context windows
-    max_chars = 120_000
-    if len(diff) > max_chars:
-        diff = diff[:max_chars] + f"\n\n... [diff truncated at {max_chars} chars]"
-    return diff
-
-
-def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
+    return await _cached_get(
+        f"/repos/{owner}/{repo}/pulls/{pr_number}",
+        headers=_DIFF_HEADERS,
+        max_bytes=_MAX_DIFF_BYTES,
+    )
+
+
+_FILES_PER_PAGE = 100  # GitHub's maximum
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+async def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
     """List all files changed in a GitHub Pull Request with addition/deletion counts.
 
     Args:
@@ -79,81 +239,125 @@ def list_changed_files(owner: str, repo: str, pr_number: int) -> str:
         repo: Repository name
         pr_number: Pull request number
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/pulls/{pr_number}/files"
-    with httpx.Client(timeout=30) as http:
-        resp = http.get(url, headers=_gh_headers(), params={"per_page": 100})
-        resp.raise_for_status()
-    files = resp.json()
-    result = []
-    for f in files:
-        result.append(
-            {
-                "filename": f["filename"],
-                "status": f["status"],
-                "additions": f["additions"],
-                "deletions": f["deletions"],
-                "changes": f["changes"],
-            }
+    path = f"/repos/{owner}/{repo}/pulls/{pr_number}/files"
+    first, link = await _cached_fetch(path, params={"per_page": _FILES_PER_PAGE})
+    files = orjson.loads(first)
+    # PRs with more than one page of files: the Link header names the last
+    # page, so the remaining pages can be fetched concurrently.
+    if last := _LAST_PAGE_RE.search(link):
+        pages = await asyncio.gather(
+            *(
+                _cached_get(path, params={"per_page": _FILES_PER_PAGE, "page": page})
+                for page in range(2, int(last.group(1)) + 1)
+            )
         )
-    return json.dumps(result, indent=2)
+        for page in pages:
+            files.extend(orjson.loads(page))
+    result = [
+        {
+            "filename": f["filename"],
+            "status": f["status"],
+            "additions": f["additions"],
+            "deletions": f["deletions"],
+            "changes": f["changes"],
+            "ref": _head_ref(f.get("contents_url", "")),
+        }
+        for f in files
+    ]
+    return orjson.dumps(result).decode()
 
 
-def read_file(owner: str, repo: str, path: str, ref: str) -> str:
+def _head_ref(contents_url: str) -> str:
+    """Extract the head commit SHA from a PR file's ``contents_url``."""
+    return parse_qs(urlsplit(contents_url).query).get("ref", [""])[0]
+
+
+async def read_file(owner: str, repo: str, path: str, ref: str) -> str:
     """Read the full content of a file from the PR's head branch.
 
     Args:
         owner: Repository owner (user or org)
         repo: Repository name
         path: File path relative to repo root
-        ref: Git ref (branch, tag, or SHA) — use PR head branch
+        ref: Git ref (branch, tag, or SHA) — use the ``ref`` from list_changed_files
     """
-    url = f"{_GITHUB_API}/repos/{owner}/{repo}/contents/{path}"
-    with httpx.Client(timeout=30) as http:
-        resp = http.get(
-            url,
-            headers={**_gh_headers(), "Accept": "application/vnd.github.v3.raw"},
-            params={"ref": ref},
-        )
-        resp.raise_for_status()
-    content = resp.text
-    max_chars = 80_000
-    if len(content) > max_chars:
-        content = content[:max_chars] + f"\n\n... [file truncated at {max_chars} chars]"
-    return content
+    return await _cached_get(
+        f"/repos/{owner}/{repo}/contents/{path}",
+        params={"ref": ref},
+        headers=_RAW_HEADERS,
+        max_bytes=_MAX_FILE_BYTES,
+    )
 
 
-def check_style(code: str, language: str) -> str:
-    """Run basic style checks on a code snippet. Returns a list of style issues.
+async def read_files(owner: str, repo: str, paths: list[str], ref: str) -> str:
+    """Read several files from the PR's head branch in one call.
+
+    All requests are issued at once on the shared client, so HTTP/2
+    multiplexes them over a single connection.
 
     Args:
-        code: Code snippet to check
-        language: Programming language (python, javascript, typescript, etc.)
+        owner: Repository owner (user or org)
+        repo: Repository name
+        paths: File paths relative to repo root
+        ref: Git ref (branch, tag, or SHA) — use the ``ref`` from list_changed_files
     """
-    issues: list[dict] = []
+    results = await asyncio.gather(
+        *(read_file(owner, repo, path, ref) for path in paths),
+        return_exceptions=True,
+    )
+    return orjson.dumps(
+        {
+            path: {"error": str(result)} if isinstance(result, Exception) else result
+            for path, result in zip(paths, results)
+        }
+    ).decode()
 
-    if language.lower() in ("python", "py"):
-        # Basic Python style checks
-        lines = code.split("\n")
-        for i, line in enumerate(lines, 1):
-            # Line length
-            if len(line) > 120:
-                issues.append(
-                    {
-                        "line": i,
-                        "rule": "line-too-long",
-                        "message": f"Line is {len(line)} chars (max 120)",
-                    }
-                )
-            # Trailing whitespace
-            if line != line.rstrip():
-                issues.append(
-                    {
-                        "line": i,
-                        "rule": "trailing-whitespace",
-                        "message": "Trailing whitespace",
-                    }
-                )
-            # Bare except
+
+_TODO_TAGS = ("TODO", "FIXME", "HACK", "XXX")
+
+
+_PYTHON_LANGUAGES = frozenset({"python", "py"})
+_CLEAN_RESULT = orjson.dumps({"status": "clean", "issues": []}).decode()
+
+
+@functools.lru_cache(maxsize=256)
+def _syntax_error(code: str) -> tuple[int, str] | None:
+    """Return ``(line, message)`` if ``code`` is not valid Python, else None.
+
+    Memoized because the Plan & Review agent re-checks the same snippet
+    and parsing is the most expensive step of a style check.
+    """
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        return e.lineno or 0, e.msg
+    return None
+
+
+def _rule_issues(code: str, is_python: bool) -> list[dict]:
+    """Per-line rule issues, in line-then-rule order."""
+    issues: list[dict] = []
+    for i, line in enumerate(code.split("\n"), 1):
+        if len(line) > 120:
+            issues.append(
+                {
+                    "line": i,
+                    "rule": "line-too-long",
+                    "message": f"Line is {len(line)} chars (max 120)",
+                }
+            )
+        # Same test as ``line != line.rstrip()`` without building a copy
+        if line[-1:].isspace():
+            issues.append(
+                {
+                    "line": i,
+                    "rule": "trailing-whitespace",
+                    "message": "Trailing whitespace",
+                }
+            )
+        if not is_python:
+            continue
+        if "except" in line:
             stripped = line.strip()
             if stripped == "except:" or stripped.startswith("except :"):
                 issues.append(
@@ -163,50 +367,95 @@ def check_style(code: str, language: str) -> str:
                         "message": "Bare except clause — catch specific exceptions",
                     }
                 )
-            # TODO/FIXME/HACK comments
-            if any(tag in line.upper() for tag in ("TODO", "FIXME", "HACK", "XXX")):
-                issues.append(
-                    {
-                        "line": i,
-                        "rule": "todo-comment",
-                        "message": f"Contains TODO/FIXME/HACK marker",
-                    }
-                )
-
-        # Try to parse as valid Python
-        try:
-            import ast
-
-            ast.parse(code)
-        except SyntaxError as e:
+        upper = line.upper()
+        if any(tag in upper for tag in _TODO_TAGS):
             issues.append(
                 {
-                    "line": e.lineno or 0,
-                    "rule": "syntax-error",
-                    "message": f"Syntax error: {e.msg}",
+                    "line": i,
+                    "rule": "todo-comment",
+                    "message": "Contains TODO/FIXME/HACK marker",
                 }
             )
-    else:
-        # Generic checks for other languages
-        lines = code.split("\n")
-        for i, line in enumerate(lines, 1):
-            if len(line) > 120:
-                issues.append(
-                    {
-                        "line": i,
-                        "rule": "line-too-long",
-                        "message": f"Line is {len(line)} chars (max 120)",
-                    }
-                )
-            if line != line.rstrip():
-                issues.append(
-                    {
-                        "line": i,
-                        "rule": "trailing-whitespace",
-                        "message": "Trailing whitespace",
-                    }
-                )
+    return issues
 
+
+def _style_result(issues: list[dict], error: tuple[int, str] | None) -> str:
+    """Encode the check_style result, appending the syntax error if any."""
+    if error is not None:
+        issues.append(
+            {
+                "line": error[0],
+                "rule": "syntax-error",
+                "message": f"Syntax error: {error[1]}",
+            }
+        )
     if not issues:
-        return json.dumps({"status": "clean", "issues": []})
-    return json.dumps({"status": "issues_found", "count": len(issues), "issues": issues}, indent=2)
+        return _CLEAN_RESULT
+    return orjson.dumps(
+        {"status": "issues_found", "count": len(issues), "issues": issues}
+    ).decode()
+
+
+def _check_style_sync(code: str, is_python: bool) -> str:
+    """Whole style check in one call; runs inside a pool worker process."""
+    error = _syntax_error(code) if is_python else None
+    return _style_result(_rule_issues(code, is_python), error)
+
+
+# Above this size the per-line rule loop and the parse hold the GIL long
+# enough to stall other tool calls, so the check runs in a separate process.
+_PROCESS_POOL_MIN_CHARS = 16 * 1024
+# Large checks are occasional; a couple of workers keep them off the loop
+# without starting one process per CPU.
+_PROCESS_POOL_WORKERS = 2
+
+
+@functools.cache
+def _process_pool() -> ProcessPoolExecutor:
+    """Create the style-check worker pool on first use.
+
+    Workers are not forked: by now the process runs asyncio.to_thread
+    threads, and forking a multi-threaded process can deadlock the child.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=_PROCESS_POOL_WORKERS, mp_context=context)
+
+
+# _syntax_error's lru_cache lives in whichever worker ran the check, so a
+# repeated large snippet would be pickled to a worker and re-parsed anyway.
+# Pool results are therefore memoized in the parent, keyed on a digest so
+# large snippets are not pinned in memory.
+_POOL_RESULTS: OrderedDict[tuple[bytes, bool], str] = OrderedDict()
+_POOL_RESULTS_SIZE = 64
+
+
+async def check_style(code: str, language: str) -> str:
+    """Run basic style checks on a code snippet. Returns a list of style issues.
+
+    Args:
+        code: Code snippet to check
+        language: Programming language (python, javascript, typescript, etc.)
+    """
+    if not code:  # nothing to scan or parse
+        return _CLEAN_RESULT
+    is_python = language.lower() in _PYTHON_LANGUAGES
+
+    if len(code) > _PROCESS_POOL_MIN_CHARS:
+        digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16)
+        key = (digest.digest(), is_python)
+        result = _POOL_RESULTS.get(key)
+        if result is not None:
+            _POOL_RESULTS.move_to_end(key)
+            return result
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_process_pool(), _check_style_sync, code, is_python)
+        _POOL_RESULTS[key] = result
+        if len(_POOL_RESULTS) > _POOL_RESULTS_SIZE:
+            _POOL_RESULTS.popitem(last=False)
+        return result
+
+    issues = _rule_issues(code, is_python)
+    # Parse off the event loop so concurrent GitHub tool calls keep going
+    error = await asyncio.to_thread(_syntax_error, code) if is_python else None
+    return _style_result(issues, error)
@@ -78,7 +78,7 @@ READ_FILE = {
                 },
                 "ref": {
                     "type": "string",
-                    "description": "Git ref (branch, tag, or SHA) — use PR head branch",
+                    "description": "Git ref (branch, tag, or SHA) — use the `ref` from list_changed_files",
                 },
             },
             "required": ["owner", "repo", "path", "ref"],
@@ -86,6 +86,40 @@ READ_FILE = {
     },
 }
 
+READ_FILES = {
+    "type": "function",
+    "function": {
+        "name": "read_files",
+        "description": (
+            "Read the full content of several files from the PR's head branch in one call. "
+            "Prefer this over repeated read_file calls when reviewing multiple files."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "owner": {
+                    "type": "string",
+                    "description": "Repository owner",
+                },
+                "repo": {
+                    "type": "string",
+                    "description": "Repository name",
+                },
+                "paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "File paths relative to repo root",
+                },
+                "ref": {
+                    "type": "string",
+                    "description": "Git ref (branch, tag, or SHA) — use the `ref` from list_changed_files",
+                },
+            },
+            "required": ["owner", "repo", "paths", "ref"],
+        },
+    },
+}
+
 CHECK_STYLE = {
     "type": "function",
     "function": {
@@ -110,8 +144,12 @@ CHECK_STYLE = {
 
 
 # ── Convenience groupings ──────────────────────────────────────────────
+#
+# Tuples, so the groupings shared by every agent build cannot be mutated
+# by one caller and leak into the next (the SDK accepts any sequence).
 
-PLANNER_TOOLS = [FETCH_PR_DIFF, LIST_CHANGED_FILES]
-REVIEWER_TOOLS = [READ_FILE, CHECK_STYLE]
-VERIFIER_TOOLS = [{"type": "code_interpreter"}]
-REPORTER_TOOLS: list = []  # Reporter uses structured output only
+PLANNER_TOOLS: tuple[dict, ...] = (FETCH_PR_DIFF, LIST_CHANGED_FILES)
+REVIEWER_TOOLS: tuple[dict, ...] = (READ_FILE, READ_FILES, CHECK_STYLE)
+PLAN_AND_REVIEW_TOOLS = PLANNER_TOOLS + REVIEWER_TOOLS  # single combined agent
+VERIFIER_TOOLS: tuple[dict, ...] = ({"type": "code_interpreter"},)
+REPORTER_TOOLS: tuple[dict, ...] = ()  # Reporter uses structured output only